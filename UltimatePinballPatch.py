@@ -1,17 +1,310 @@
+import atexit
 import base64
+import functools
+import mmap
 import os
-import glob
+import sys
 import shutil
 import traceback
-from struct import pack
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from struct import Struct
+import numpy as np
 from PIL import Image
 from colorama import Fore, Back, Style
 
+# Numba is optional: when it is installed the LZSS decompressor below is JIT-compiled to native
+# code, otherwise the same function runs interpreted.
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Colorama codes used by the per-operation console output, looked up once instead of through the
+# Fore/Style attribute machinery on every print
+_YELLOW, _CYAN, _MAGENTA, _RESET = Fore.YELLOW, Fore.CYAN, Fore.MAGENTA, Style.RESET_ALL
+
+# On a terminal stdout flushes after every line, which dominates wall time for scripts emitting
+# thousands of operation messages; buffer fully and flush alongside the deferred archive saves
+if hasattr(sys.stdout, 'reconfigure'):
+    sys.stdout.reconfigure(line_buffering=False)
+
+# Precompiled struct instances for the integer readers. Compiling the format once and reusing the
+# Struct object keeps the per-field cost down to a single C-level unpack_from call with no
+# intermediate slice allocation.
+_S_I16 = Struct('<h')
+_S_U16 = Struct('<H')
+_S_I32 = Struct('<i')
+_S_U32 = Struct('<I')
+_S_4U32 = Struct('<IIII')
+
+# The unpack_from bound methods, resolved once so the readers skip even the attribute lookup
+_UNPACK_I16 = _S_I16.unpack_from
+_UNPACK_U16 = _S_U16.unpack_from
+_UNPACK_I32 = _S_I32.unpack_from
+_UNPACK_U32 = _S_U32.unpack_from
+_UNPACK_4U32 = _S_4U32.unpack_from
+_S_DIRENT = Struct('<32sIIII')
+
+# Sprite bank record headers: five u32 fields per sprite, s16 draw offset + u16 length per chunk
+_SPRITE_HDR = Struct('<IIIII')
+_CHUNK_HDR = Struct('<hH')
+
+# Layout of one 48-byte directory entry in a BNK archive, used to parse the whole entry table in a
+# single NumPy pass instead of one field at a time
+_ENTRY_DTYPE = np.dtype([('name', 'S32'), ('off', '<u4'), ('csize', '<u4'),
+                         ('usize', '<u4'), ('flag', '<u4')])
+
+def _lzss_decompress(data, expected_size):
+    """
+    Decompresses an LZSS-style compressed byte stream.
+
+    Walks the stream of control bytes, copying literal bytes and expanding back-references through a
+    4096-byte circular buffer, exactly as the game's own decompressor does. Written against NumPy
+    arrays so that Numba can compile it to native code when available.
+
+    Parameters:
+        data (numpy.ndarray): The compressed stream as a uint8 array.
+        expected_size (int): The expected size of the decompressed output.
+
+    Returns:
+        numpy.ndarray: The decompressed bytes as a uint8 array.
+    """
+    # Preallocate the output with headroom for one final control byte's worth of overshoot, so a
+    # corrupt stream runs past expected_size without writing out of bounds (the caller detects the
+    # size mismatch afterwards).
+    out = np.empty(expected_size + 152, np.uint8)
+    oi = 0
+
+    dest_buffer = np.zeros(4096, np.uint8)  # Circular buffer for back-references
+    buffer_pointer = 0xFEE  # Initial buffer pointer, specific to decompression logic
+
+    i = 0
+    n = data.shape[0]
+    while i < n and oi <= expected_size:
+        control_byte = data[i]
+        i += 1
+
+        # All 8 bit slots are walked even once the control byte shifts to zero, since clear bits
+        # encode back-references rather than "no operation"
+        for bit in range(8):
+            if i >= n:
+                break  # End of data reached
+
+            if control_byte & 1:
+                # Literal byte copy operation
+                byte = data[i]
+                i += 1
+                out[oi] = byte
+                oi += 1
+                dest_buffer[buffer_pointer] = byte
+                buffer_pointer = (buffer_pointer + 1) & 0xFFF
+            else:
+                # Back-reference copy operation
+                if i + 1 >= n:
+                    break  # Prevent buffer overrun
+
+                offset = ((int(data[i + 1]) & 0xF0) << 4) | int(data[i])
+                length = (int(data[i + 1]) & 0x0F) + 3
+                i += 2
+
+                for j in range(length):
+                    byte = dest_buffer[(offset + j) & 0xFFF]
+                    out[oi] = byte
+                    oi += 1
+                    dest_buffer[buffer_pointer] = byte
+                    buffer_pointer = (buffer_pointer + 1) & 0xFFF
+
+            control_byte >>= 1
+
+    return out[:oi]
+
+# Compile the decompressor with Numba when available; the JIT cost is paid once and cached.
+if njit is not None:
+    _lzss_decompress = njit(cache=True, boundscheck=False)(_lzss_decompress)
+
+def _lzss_decompress_py(data, expected_size):
+    """
+    Pure-Python fallback for _lzss_decompress, used when Numba is not installed.
+
+    Produces identical output to the compiled kernel, but writes every byte once: instead of
+    mirroring the output into a separate 4096-byte circular buffer, the output itself (behind a
+    4096-byte virtual prefix of zeros standing in for the zero-initialized buffer) serves as the
+    back-reference window. A reference to window position q at output index t always resolves to
+    the fixed distance d = (t + 0xFEE - q) & 0xFFF (or 4096 when that is zero), so each
+    back-reference becomes a single overlapping forward copy from t - d.
+
+    Parameters:
+        data (bytes): The compressed stream.
+        expected_size (int): The expected size of the decompressed output.
+
+    Returns:
+        bytes: The decompressed bytes.
+    """
+    # Preallocate the output behind the virtual window prefix, with the same overshoot headroom as
+    # the compiled kernel, and track the write position with an index
+    prefix = 0x1000
+    out = bytearray(prefix + expected_size + 152)
+    di = prefix
+
+    i = 0
+    n = len(data)
+    limit = prefix + expected_size
+    while i < n and di <= limit:
+        control_byte = data[i]
+        i += 1
+
+        # All 8 bit slots are walked even once the control byte shifts to zero, since clear bits
+        # encode back-references rather than "no operation"
+        for _ in range(8):
+            if i >= n:
+                break  # End of data reached
+
+            if control_byte & 1:
+                # Literal byte copy operation
+                out[di] = data[i]
+                i += 1
+                di += 1
+            else:
+                # Back-reference copy operation
+                if i + 1 >= n:
+                    break  # Prevent buffer overrun
+
+                offset = ((data[i + 1] & 0xF0) << 4) | data[i]
+                length = (data[i + 1] & 0x0F) + 3
+                i += 2
+
+                # Distance back from the write position to the referenced window bytes
+                distance = (di + 0xFEE - offset) & 0xFFF
+                if distance == 0:
+                    distance = 0x1000
+                src = di - distance
+
+                if distance >= length:
+                    # Disjoint ranges: copy the whole reference as one slice operation
+                    out[di:di+length] = out[src:src+length]
+                    di += length
+                else:
+                    # Overlapping (run-length) reference: copy forward byte by byte so each read
+                    # observes the bytes written earlier in this same reference
+                    for j in range(length):
+                        out[di] = out[src + j]
+                        di += 1
+
+            control_byte >>= 1
+
+    return bytes(out[prefix:di])
+
+def _render_sprite(archive, chunk_offsets, chunk_lengths, draw_offsets, width, palette, out):
+    """
+    Renders one sprite's chunks into a flat (pixels, 4) RGBA array.
+
+    Walks the chunk records, advancing the running linear draw offset per the signed relative
+    draw offsets, and translates each chunk's palette indices through the RGBA lookup table.
+    Compiled with Numba when available, which is why errors are reported through the return
+    value rather than raised here.
+
+    Parameters:
+        archive (ndarray): The whole sprite bank as a uint8 array.
+        chunk_offsets (ndarray): Byte offset of each chunk's pixel run within the archive.
+        chunk_lengths (ndarray): Pixel count of each chunk (0xFFFF marks a skip record).
+        draw_offsets (ndarray): Signed relative draw offset of each chunk.
+        width (int): The sprite width in pixels.
+        palette (ndarray): The (256, 4) uint8 RGBA lookup table.
+        out (ndarray): The flat (pixels, 4) uint8 output array, written in place.
+
+    Returns:
+        tuple: (-1, 0) on success, or (chunk index, linear draw offset) for a chunk that would
+               wrap past the end of its row or run past the end of the pixel buffer.
+    """
+    draw_offset = 0
+    for i in range(chunk_offsets.shape[0]):
+        rel = draw_offsets[i]
+        if rel >= 0:
+            draw_offset += rel
+        else:
+            draw_offset += width + rel + 1
+
+        length = chunk_lengths[i]
+        if length == 0xFFFF:
+            continue
+
+        # Chunks never span rows; a run past the row end means the bank is corrupt. The pixel
+        # buffer bound must be checked explicitly since the kernel compiles without bounds checks.
+        if draw_offset % width + length > width or draw_offset + length > out.shape[0]:
+            return i, draw_offset
+
+        offset = chunk_offsets[i]
+        for j in range(length):
+            out[draw_offset + j] = palette[archive[offset + j]]
+        draw_offset += length
+
+    return -1, 0
+
+# Compile the sprite renderer with Numba when available, alongside the decompressor.
+if njit is not None:
+    _render_sprite = njit(cache=True, boundscheck=False)(_render_sprite)
+
+def _render_sprite_py(archive, chunk_offsets, chunk_lengths, draw_offsets, width, palette, out):
+    """
+    NumPy fallback for _render_sprite, used when Numba is not installed.
+
+    Same contract as the compiled kernel, but each chunk is blitted as one vectorized palette
+    lookup plus slice assignment instead of a scalar pixel loop.
+    """
+    draw_offset = 0
+    for i in range(len(chunk_offsets)):
+        rel = draw_offsets[i]
+        if rel >= 0:
+            draw_offset += rel
+        else:
+            draw_offset += width + rel + 1
+
+        length = chunk_lengths[i]
+        if length == 0xFFFF:
+            continue
+
+        # Chunks never span rows; a run past the row end means the bank is corrupt, as does a
+        # run past the end of the pixel buffer
+        if draw_offset % width + length > width or draw_offset + length > out.shape[0]:
+            return i, draw_offset
+
+        offset = chunk_offsets[i]
+        out[draw_offset:draw_offset + length] = palette[archive[offset:offset + length]]
+        draw_offset += length
+
+    return -1, 0
+
 class PatchTool:
 
     cached_source_archives = {}
     cached_destination_archives = {}
 
+    # Destination archive paths with unsaved modifications, written out by flush()
+    _dirty = set()
+
+    # Files already backed up during this run, so backup_file can skip repeated stat calls
+    _backed_up = set()
+
+    # When False, the per-operation console messages are suppressed for silent batch runs
+    verbose = True
+
+    @staticmethod
+    def flush():
+        """
+        Writes out all destination archives with pending modifications.
+
+        Archives mutated by bnk_add/bnk_replace are only marked dirty rather than saved on every
+        operation, so a script issuing many operations against the same archive rewrites it once
+        instead of once per operation. Called automatically at interpreter exit.
+        """
+        for archive_path in PatchTool._dirty:
+            PatchTool.cached_destination_archives[archive_path].save()
+        PatchTool._dirty.clear()
+
+        # Push out any operation messages buffered since line buffering is disabled
+        sys.stdout.flush()
+
     @staticmethod
     def read_int16(data, offset):
         """
@@ -27,9 +320,8 @@ class PatchTool:
         Returns:
             int: A 16-bit signed integer.
         """
-        # Extracts a 2-byte segment from the byte array starting at the given offset
-        # Converts this 2-byte segment to a 16-bit integer
-        return int.from_bytes(data[offset:offset+2], byteorder='little', signed=True)
+        # Unpacks a 16-bit integer directly from the byte array at the given offset
+        return _UNPACK_I16(data, offset)[0]
 
     @staticmethod
     def read_uint16(data, offset):
@@ -46,9 +338,8 @@ class PatchTool:
         Returns:
             int: A 16-bit unsigned integer.
         """
-        # Extracts a 2-byte segment from the byte array starting at the given offset
-        # Converts this 2-byte segment to a 16-bit integer
-        return int.from_bytes(data[offset:offset+2], byteorder='little', signed=False)
+        # Unpacks a 16-bit integer directly from the byte array at the given offset
+        return _UNPACK_U16(data, offset)[0]
 
     @staticmethod
     def read_int32(data, offset):
@@ -65,9 +356,8 @@ class PatchTool:
         Returns:
             int: A 32-bit signed integer.
         """
-        # Extracts a 4-byte segment from the byte array starting at the given offset
-        # Converts this 4-byte segment to a 32-bit integer
-        return int.from_bytes(data[offset:offset+4], byteorder='little', signed=True)
+        # Unpacks a 32-bit integer directly from the byte array at the given offset
+        return _UNPACK_I32(data, offset)[0]
 
     @staticmethod
     def read_uint32(data, offset):
@@ -84,17 +374,16 @@ class PatchTool:
         Returns:
             int: A 32-bit unsigned integer.
         """
-        # Extracts a 4-byte segment from the byte array starting at the given offset
-        # Converts this 4-byte segment to a 32-bit integer
-        return int.from_bytes(data[offset:offset+4], byteorder='little', signed=False)
+        # Unpacks a 32-bit integer directly from the byte array at the given offset
+        return _UNPACK_U32(data, offset)[0]
 
     @staticmethod
     def read_byte_array(data, offset, size):
         """
         Extracts a segment of a byte array starting from a specified offset.
 
-        Returns a byte array containing the extracted segment, starting at the specified offset and spanning the given
-        size.
+        Returns a zero-copy memoryview of the segment, starting at the specified offset and spanning the given size.
+        Callers that need an independent, hashable value (e.g. an entry name) should wrap the result in bytes().
 
         Parameters:
             data (bytes): The byte array to extract the segment from.
@@ -102,10 +391,10 @@ class PatchTool:
             size (int): The length of the byte segment to extract.
 
         Returns:
-            bytes: The specified segment of the byte array.
+            memoryview: A view of the specified segment of the byte array.
         """
-        # Extracts a segment of the byte array starting at offset and ending at offset + size (exclusive)
-        return data[offset:offset+size]
+        # Takes a zero-copy view of the byte array from offset to offset + size (exclusive)
+        return memoryview(data)[offset:offset+size]
 
     @staticmethod
     def read_string(data):
@@ -120,21 +409,178 @@ class PatchTool:
         Returns:
             str: A string extracted from the byte array.
         """
-        # Finds the position of the first null byte in the array
+        # Strips the trailing null padding in one C call; names are short with long null tails, so
+        # this is cheaper than scanning forward for the first null
+        data = data.rstrip(b'\x00')
+
+        # A null byte left in the middle means the padding was not clean, so truncate at the first
+        # null to keep the documented semantics
         if (null_pos := data.find(0)) != -1:
-            # Extracts the byte array segment representing the string
             data = data[:null_pos]
 
         # Converts it to a Python string
-        return data.decode('utf-8').strip()
+        return data.decode('utf-8', 'replace').strip()
+
+    @staticmethod
+    def _load_source_archive(archive_path):
+        """
+        Loads a source archive, reusing the cached copy when available.
+
+        Parameters:
+            archive_path (str): The file path of the source BNK archive.
+
+        Returns:
+            BNKArchive: The loaded (or cached) archive.
+        """
+        source_archive = PatchTool.cached_source_archives.get(archive_path)
+        if source_archive is None:
+            source_archive = BNKArchive(archive_path)
+            PatchTool.cached_source_archives[archive_path] = source_archive
+        return source_archive
+
+    @staticmethod
+    def _open_archive_with_backup(archive_path):
+        """
+        Backs up an archive and loads it with a single read of the file.
+
+        The archive is opened and memory-mapped once; the mapping is used both as the source for
+        writing the backup (via os.sendfile where available) and as the buffer handed to the
+        archive parser, instead of shutil.copy and the archive constructor each reading the file
+        separately.
+
+        Parameters:
+            archive_path (str): The file path of the BNK archive.
+
+        Returns:
+            BNKArchive: The loaded archive, or None if the archive file does not exist.
+        """
+        if not os.path.exists(archive_path):
+            return None
+
+        fd = os.open(archive_path, os.O_RDONLY)
+        try:
+            size = os.fstat(fd).st_size
+            mm = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+
+            # Write the backup from the mapping unless one already exists
+            if archive_path not in PatchTool._backed_up:
+                backupDir = "PatchBackups"
+                if not os.path.exists(backupDir):
+                    os.makedirs(backupDir)
+
+                backupFilePath = os.path.join(backupDir, os.path.basename(archive_path))
+                if not os.path.exists(backupFilePath):
+                    backup_fd = os.open(backupFilePath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+                    try:
+                        if hasattr(os, 'sendfile'):
+                            # Zero-copy kernel-side transfer on platforms that support it
+                            sent = 0
+                            while sent < size:
+                                sent += os.sendfile(backup_fd, fd, sent, size - sent)
+                        else:
+                            os.write(backup_fd, mm)
+                    finally:
+                        os.close(backup_fd)
+                PatchTool._backed_up.add(archive_path)
+
+            # Parse the archive straight from the mapping; the archive keeps the mapping alive for
+            # as long as its entry payloads view into it
+            return BNKArchive.from_buffer(archive_path, mm)
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def _load_destination_archive(archive_path):
+        """
+        Backs up and loads a destination archive, reusing the cached copy when available.
+
+        Parameters:
+            archive_path (str): The file path of the destination BNK archive.
+
+        Returns:
+            BNKArchive: The loaded (or cached) archive, or None if the archive file does not exist.
+        """
+        destination_archive = PatchTool.cached_destination_archives.get(archive_path)
+        if destination_archive is None:
+            destination_archive = PatchTool._open_archive_with_backup(archive_path)
+            if destination_archive is not None:
+                PatchTool.cached_destination_archives[archive_path] = destination_archive
+        return destination_archive
+
+    @staticmethod
+    def bnk_add_from_path(source_archive_path, source_entry, destination_archive_path, destination_entry,
+                          force_replace=False):
+        """
+        Adds an entry from a source BNK archive to a destination BNK archive.
+
+        Performs a backup of the destination archive before adding; the operation is skipped when the destination
+        archive is missing. The save is deferred until PatchTool.flush().
+
+        Parameters:
+            source_archive_path (str): The file path of the source archive.
+            source_entry (str): The name of the entry to copy from the source archive.
+            destination_archive_path (str): The file path of the destination archive.
+            destination_entry (str): The name to add the entry under in the destination archive.
+            force_replace (bool): Whether to replace the destination entry if it already exists.
+        """
+        # Display the process of adding an entry in the console.
+        if PatchTool.verbose:
+            print(f"- Copying entry {_YELLOW}{source_archive_path}{_RESET}" +
+                  f":{_CYAN}{source_entry}{_RESET}" +
+                  f" -> {_YELLOW}{destination_archive_path}{_RESET}" +
+                  f":{_CYAN}{destination_entry}{_RESET}.")
+
+        # Back up and load the destination archive in one pass; skip the operation when the
+        # destination archive is missing.
+        destination_archive = PatchTool._load_destination_archive(destination_archive_path)
+        if destination_archive is None:
+            return
+
+        # Grab the source entry from the (possibly cached) source archive.
+        entry = PatchTool._load_source_archive(source_archive_path).get_entry(source_entry)
+
+        # Add the entry to the destination archive and schedule a save.
+        destination_archive.add_entry_as(destination_entry, entry, force_replace)
+        PatchTool._dirty.add(destination_archive_path)
+
+    @staticmethod
+    def bnk_add_from_entry(entry, destination_archive_path, destination_entry, force_replace=False):
+        """
+        Adds a BNKEntry object to a destination BNK archive.
+
+        Performs a backup of the destination archive before adding; the operation is skipped when the destination
+        archive is missing. The save is deferred until PatchTool.flush().
+
+        Parameters:
+            entry (BNKEntry): The entry to add.
+            destination_archive_path (str): The file path of the destination archive.
+            destination_entry (str): The name to add the entry under in the destination archive.
+            force_replace (bool): Whether to replace the destination entry if it already exists.
+        """
+        # Display the process of adding an entry in the console.
+        if PatchTool.verbose:
+            print(f"- Copying entry {_MAGENTA}Internal{_RESET}" +
+                  f":{_CYAN}{PatchTool.read_string(entry.name)}{_RESET}" +
+                  f" -> {_YELLOW}{destination_archive_path}{_RESET}" +
+                  f":{_CYAN}{destination_entry}{_RESET}.")
+
+        # Back up and load the destination archive in one pass; skip the operation when the
+        # destination archive is missing.
+        destination_archive = PatchTool._load_destination_archive(destination_archive_path)
+        if destination_archive is None:
+            return
+
+        # Add the entry to the destination archive and schedule a save.
+        destination_archive.add_entry_as(destination_entry, entry, force_replace)
+        PatchTool._dirty.add(destination_archive_path)
 
     @staticmethod
     def bnk_add(*args):
         """
         Adds an entry from one BNK archive to another.
 
-        Performs a backup of the destination archive before adding. It loads both source and destination archives,
-        clones the specified entry from the source, adds it to the destination, and then saves the changes.
+        Thin compatibility shim that routes to bnk_add_from_path or bnk_add_from_entry based on the type of the first
+        argument.
 
         Parameters:
         *args: A variable argument list containing either:
@@ -158,62 +604,91 @@ class PatchTool:
         if len(args) not in [2, 3]:
             raise ValueError("Invalid number of arguments provided for BNKAdd function")
 
+        destination_archive_path, destination_entry = args[1].split(":")
+        force_replace = args[2] if len(args) == 3 else False
+
         if isinstance(args[0], str):
             source_archive_path, source_entry = args[0].split(":")
-            destination_archive_path, destination_entry = args[1].split(":")
-            force_replace = args[2] if len(args) == 3 else False
-
-            # Display the process of adding an entry in the console.
-            print(f"- Copying entry {Fore.YELLOW}{source_archive_path}{Style.RESET_ALL}" +
-                  f":{Fore.CYAN}{source_entry}{Style.RESET_ALL}" +
-                  f" -> {Fore.YELLOW}{destination_archive_path}{Style.RESET_ALL}" +
-                  f":{Fore.CYAN}{destination_entry}{Style.RESET_ALL}.")
-
-            # Perform a backup before modifying the destination archive.
-            if PatchTool.backup_file(destination_archive_path):
-                # Load the source archive and cache it or grab the cached copy.
-                source_archive = PatchTool.cached_source_archives.get(source_archive_path)
-                if source_archive is None:
-                    source_archive = BNKArchive(source_archive_path)
-                    PatchTool.cached_source_archives[source_archive] = source_archive
-
-                # Load the destination archive and cache it or grab the cached copy.
-                destination_archive = PatchTool.cached_destination_archives.get(destination_archive_path)
-                if destination_archive is None:
-                    destination_archive = BNKArchive(destination_archive_path)
-                    PatchTool.cached_destination_archives[destination_archive] = destination_archive
-
-                # Grab the source entry.
-                entry = source_archive.get_entry(source_entry)
-
+            PatchTool.bnk_add_from_path(source_archive_path, source_entry,
+                                        destination_archive_path, destination_entry, force_replace)
         elif isinstance(args[0], BNKEntry):
-            entry = args[0]
-            destination_archive_path, destination_entry = args[1].split(":")
-            force_replace = args[2] if len(args) == 3 else False
-
-            # Display the process of adding an entry in the console.
-            print(f"- Copying entry {Fore.MAGENTA}Internal{Style.RESET_ALL}" +
-                  f":{Fore.CYAN}{PatchTool.read_string(entry.name)}{Style.RESET_ALL}" +
-                  f" -> {Fore.YELLOW}{destination_archive_path}{Style.RESET_ALL}" +
-                  f":{Fore.CYAN}{destination_entry}{Style.RESET_ALL}.")
-
-        # Perform a backup before modifying the destination archive.
-        if PatchTool.backup_file(destination_archive_path):
-            # Load the destination archive and cache it or grab the cached copy.
-            destination_archive = PatchTool.cached_destination_archives.get(destination_archive_path)
-            if destination_archive is None:
-                destination_archive = BNKArchive(destination_archive_path)
-                PatchTool.cached_destination_archives[destination_archive] = destination_archive
-
-            # Add the entry to the destination archive and save it.
-            destination_archive.add_entry(destination_entry, entry, force_replace)
-            destination_archive.save()
+            PatchTool.bnk_add_from_entry(args[0], destination_archive_path, destination_entry, force_replace)
+        else:
+            raise ValueError("Invalid argument types.")
+
+    @staticmethod
+    def bnk_replace_from_path(source_archive_path, source_entry_name, destination_archive_path,
+                              destination_entry_name):
+        """
+        Replaces an entry in a destination BNK archive with an entry from a source BNK archive.
+
+        Performs a backup of the destination archive before replacing; the operation is skipped when the destination
+        archive is missing. The save is deferred until PatchTool.flush().
+
+        Parameters:
+            source_archive_path (str): The file path of the source archive.
+            source_entry_name (str): The name of the entry to copy from the source archive.
+            destination_archive_path (str): The file path of the destination archive.
+            destination_entry_name (str): The name of the entry to replace in the destination archive.
+        """
+        # Display the process of replacing an entry in the console
+        if PatchTool.verbose:
+            print(f"- Copying entry {_YELLOW}{source_archive_path}{_RESET}" +
+                  f":{_CYAN}{source_entry_name}{_RESET}" +
+                  f" -> {_YELLOW}{destination_archive_path}{_RESET}" +
+                  f":{_CYAN}{destination_entry_name}{_RESET}.")
+
+        # Back up and load the destination archive in one pass; skip the operation when the
+        # destination archive is missing
+        destination_archive = PatchTool._load_destination_archive(destination_archive_path)
+        if destination_archive is None:
+            return
+
+        # Grab the source entry from the (possibly cached) source archive
+        entry = PatchTool._load_source_archive(source_archive_path).get_entry(source_entry_name)
+
+        # Replace the entry in the destination archive with the entry and schedule a save
+        destination_archive.replace_entry_as(destination_entry_name, entry)
+        PatchTool._dirty.add(destination_archive_path)
+
+    @staticmethod
+    def bnk_replace_from_entry(entry, destination_archive_path, destination_entry_name):
+        """
+        Replaces an entry in a destination BNK archive with a BNKEntry object.
+
+        Performs a backup of the destination archive before replacing; the operation is skipped when the destination
+        archive is missing. The save is deferred until PatchTool.flush().
+
+        Parameters:
+            entry (BNKEntry): The entry providing the replacement data.
+            destination_archive_path (str): The file path of the destination archive.
+            destination_entry_name (str): The name of the entry to replace in the destination archive.
+        """
+        # Display the process of replacing an entry in the console
+        if PatchTool.verbose:
+            print(f"- Copying entry {_MAGENTA}Internal{_RESET}" +
+                  f":{_CYAN}{PatchTool.read_string(entry.name)}{_RESET}" +
+                  f" -> {_YELLOW}{destination_archive_path}{_RESET}" +
+                  f":{_CYAN}{destination_entry_name}{_RESET}.")
+
+        # Back up and load the destination archive in one pass; skip the operation when the
+        # destination archive is missing
+        destination_archive = PatchTool._load_destination_archive(destination_archive_path)
+        if destination_archive is None:
+            return
+
+        # Replace the entry in the destination archive with the entry and schedule a save
+        destination_archive.replace_entry_as(destination_entry_name, entry)
+        PatchTool._dirty.add(destination_archive_path)
 
     @staticmethod
     def bnk_replace(*args):
         """
         Replaces an entry in a BNK archive with another entry.
 
+        Thin compatibility shim that routes to bnk_replace_from_path or bnk_replace_from_entry based on the type of
+        the first argument.
+
         Parameters:
         *args: A variable argument list that can be:
             (source_archive_path_and_entry: str, destination_archive_path_and_entry: str):
@@ -232,59 +707,19 @@ class PatchTool:
 
         # Handle BNKReplace from archive paths and entry names
         if isinstance(args[0], str) and isinstance(args[1], str):
-            source_archive_path_and_entry, destination_archive_path_and_entry = args
-            source_archive_path, source_entry_name = source_archive_path_and_entry.split(':')
-            destination_archive_path, destination_entry_name = destination_archive_path_and_entry.split(':')
-
-            # Display the process of replacing an entry in the console
-            print(f"- Copying entry {Fore.YELLOW}{source_archive_path}{Style.RESET_ALL}" +
-                f":{Fore.CYAN}{source_entry_name}{Style.RESET_ALL}" +
-                f" -> {Fore.YELLOW}{destination_archive_path}{Style.RESET_ALL}" +
-                f":{Fore.CYAN}{destination_entry_name}{Style.RESET_ALL}.")
-
-            # Perform a backup before modifying the destination archive
-            if PatchTool.backup_file(destination_archive_path):
-                # Load the source archive and cache it or grab the cached copy
-                source_archive = PatchTool.cached_source_archives.get(source_archive_path)
-                if source_archive is None:
-                    source_archive = BNKArchive(source_archive_path)
-                    PatchTool.cached_source_archives[source_archive_path] = source_archive
-
-                # Load the destination archive and cache it or grab the cached copy
-                destination_archive = PatchTool.cached_destination_archives.get(destination_archive_path)
-                if destination_archive is None:
-                    destination_archive = BNKArchive(destination_archive_path)
-                    PatchTool.cached_destination_archives[destination_archive_path] = destination_archive
-
-                # Grab the source entry
-                entry = source_archive.get_entry(source_entry_name)
+            source_archive_path, source_entry_name = args[0].split(':')
+            destination_archive_path, destination_entry_name = args[1].split(':')
+            PatchTool.bnk_replace_from_path(source_archive_path, source_entry_name,
+                                            destination_archive_path, destination_entry_name)
 
         # Handle BNKReplace from BNKEntry and destination archive path and entry name
         elif isinstance(args[0], BNKEntry) and isinstance(args[1], str):
-            entry, destination_archive_path_and_entry = args
-            destination_archive_path, destination_entry_name = destination_archive_path_and_entry.split(':')
-
-            # Display the process of replacing an entry in the console
-            print(f"- Copying entry {Fore.MAGENTA}Internal{Style.RESET_ALL}" +
-                  f":{Fore.CYAN}{PatchTool.read_string(entry.name)}{Style.RESET_ALL}" +
-                  f" -> {Fore.YELLOW}{destination_archive_path}{Style.RESET_ALL}" +
-                  f":{Fore.CYAN}{destination_entry_name}{Style.RESET_ALL}.")
+            destination_archive_path, destination_entry_name = args[1].split(':')
+            PatchTool.bnk_replace_from_entry(args[0], destination_archive_path, destination_entry_name)
 
         else:
             raise ValueError("Invalid argument types.")
 
-        # Perform a backup before modifying the destination archive
-        if PatchTool.backup_file(destination_archive_path):
-            # Load the destination archive and cache it or grab the cached copy
-            destination_archive = PatchTool.cached_destination_archives.get(destination_archive_path)
-            if destination_archive is None:
-                destination_archive = BNKArchive.load(destination_archive_path)
-                PatchTool.cached_destination_archives[destination_archive_path] = destination_archive
-
-            # Replace the entry in the destination archive with the entry and save it
-            destination_archive.replace_entry(destination_entry_name, entry)
-            destination_archive.save()
-
 
     @staticmethod
     def bnk_remove(archive_path_and_entry, ignore_not_found):
@@ -299,8 +734,9 @@ class PatchTool:
         archive_path, entry_name = archive_path_and_entry.split(':')
 
         # Display the process of removing an entry in the console
-        print(f"- Deleting entry {Fore.YELLOW}{archive_path}{Style.RESET_ALL}" +
-              f":{Fore.CYAN}{entry_name}{Style.RESET_ALL}.")
+        if PatchTool.verbose:
+            print(f"- Deleting entry {_YELLOW}{archive_path}{_RESET}" +
+                  f":{_CYAN}{entry_name}{_RESET}.")
 
         # Perform a backup before modifying the archive
         if PatchTool.backup_file(archive_path):
@@ -330,26 +766,35 @@ class PatchTool:
             ignoreNotFound (bool): Ignores errors from the match not being found.
         """
         if PatchTool.backup_file(filePath):
-            # Read the file bytes
-            with open(filePath, "rb") as file:
-                fileContent = bytearray(file.read())
-
-            # Search and replace the byte sequence
-            found = False
-            for i in range(len(fileContent) - len(searchBytes) + 1):
-                if fileContent[i:i+len(searchBytes)] == searchBytes:
-                    fileContent[i:i+len(replaceBytes)] = replaceBytes
-
-                    # Write the modified bytes back to the file
+            if len(searchBytes) == len(replaceBytes) and os.path.getsize(filePath) > 0:
+                # Equal-length replacement: memory-map the file and search/patch it in place, with
+                # no read-all/rewrite-all pass over the file contents
+                with open(filePath, "r+b") as file, mmap.mmap(file.fileno(), 0) as mm:
+                    pos = mm.find(searchBytes)
+                    if pos >= 0:
+                        mm[pos:pos+len(replaceBytes)] = replaceBytes
+            else:
+                # Differing lengths shift the remainder of the file, so read and rewrite it
+                # whole; the raw descriptor read skips the BufferedReader setup for a read that
+                # always consumes the entire file
+                fd = os.open(filePath, os.O_RDONLY)
+                try:
+                    fileContent = os.read(fd, os.fstat(fd).st_size)
+                finally:
+                    os.close(fd)
+
+                pos = fileContent.find(searchBytes)
+                if pos >= 0:
+                    patched = bytearray(fileContent)
+                    patched[pos:pos+len(searchBytes)] = replaceBytes
                     with open(filePath, "wb") as file:
-                        file.write(fileContent)
+                        file.write(patched)
 
-                    print(f"- Binary patching {Fore.YELLOW}{filePath}{Style.RESET_ALL}.")
-                    found = True
-                    break
+            if pos >= 0 and PatchTool.verbose:
+                print(f"- Binary patching {_YELLOW}{filePath}{_RESET}.")
 
-            if not found and not ignoreNotFound:
-                raise Exception(f"No matching sequence found in '{Fore.YELLOW}{filePath}{Style.RESET_ALL}" +
+            if pos < 0 and not ignoreNotFound:
+                raise Exception(f"No matching sequence found in '{_YELLOW}{filePath}{_RESET}" +
                                 f"'. No changes made.")
 
 
@@ -367,6 +812,10 @@ class PatchTool:
         Returns:
             bool: True if the backup is successful or already exists, False otherwise.
         """
+        # Skip the filesystem checks entirely when this file was already backed up during this run
+        if fileName in PatchTool._backed_up:
+            return True
+
         # Check if the file exists
         if os.path.exists(fileName):
             # Create the PatchBackups directory if it doesn't exist
@@ -378,10 +827,12 @@ class PatchTool:
 
             # Check if the backup file already exists
             if os.path.exists(backupFilePath):
+                PatchTool._backed_up.add(fileName)
                 return True
 
             # Copy the file to the backup directory
             shutil.copy(fileName, backupFilePath)
+            PatchTool._backed_up.add(fileName)
             return True
         else:
             return False
@@ -394,32 +845,43 @@ class PatchTool:
         Moves files from the 'PatchBackups' directory back to their original location, overwriting existing files if
         necessary.
         """
+        # Restoring invalidates the backed-up-file memo, since the backups are moved away
+        PatchTool._backed_up.clear()
+
         # Check if the PatchBackups directory exists
         backupDir = "PatchBackups"
         if not os.path.exists(backupDir):
             print("No backup directory found.")
             return
 
-        # Get all backup files in the directory
-        backupFiles = os.listdir(backupDir)
+        # Get all backup files in the directory; scandir hands back DirEntry objects that already
+        # carry the joined path and cached stat information
+        with os.scandir(backupDir) as it:
+            backupFiles = [e for e in it if e.is_file()]
 
         if len(backupFiles) > 0:
             print("- Restoring backups.")
 
-        # Iterate through each backup file and move it to the original location
+        # Iterate through each backup file and move it to the original location, overwriting if
+        # necessary
         for file in backupFiles:
-            backupFilePath = os.path.join(backupDir, file)
-
-            # Move the backup file to the original location, overwriting if necessary
-            shutil.move(backupFilePath, file)
+            shutil.move(file.path, file.name)
 
     @staticmethod
     def extract_all_bnk_files():
-        for file_path in glob.glob("*.BNK"):
-            print(f"- Extracting files from BNK archive: {Fore.YELLOW}{file_path}{Style.RESET_ALL}")
+        # A single scandir pass with a suffix test beats glob, which walks the directory through
+        # fnmatch for every entry
+        with os.scandir('.') as it:
+            bnk_paths = sorted(e.name for e in it if e.is_file() and e.name.endswith('.BNK'))
+
+        for file_path in bnk_paths:
+            print(f"- Extracting files from BNK archive: {_YELLOW}{file_path}{_RESET}")
             bnk_archive = BNKArchive(file_path)
             bnk_archive.dump()
 
+# Make sure pending archive saves are written out even if the script never calls flush() itself
+atexit.register(PatchTool.flush)
+
 class BNKEntry:
     """
     Represents an entry in a BNK file.
@@ -428,6 +890,10 @@ class BNKEntry:
     entry's data, name, uncompressed size, and compression state.
     """
 
+    # Memoized casefolded name, computed lazily by cf_name; the class default covers every
+    # construction path without touching the constructors
+    _cf_name = None
+
     def __init__(self, *args):
         """
         Overloaded constructor for BNKEntry object.
@@ -458,14 +924,14 @@ class BNKEntry:
             self.isCompressed = None
         elif len(args) == 2 and isinstance(args[0], (bytes, bytearray)) and isinstance(args[1], int):
             archiveData, entryOffset = args
-            # Read the name (32 bytes) of the entry from the archive data at the specified entry offset
-            self.name = PatchTool.read_byte_array(archiveData, entryOffset, 32)
+            # Read the name (32 bytes) of the entry from the archive data at the specified entry offset; the name is
+            # materialized to bytes since it is used for comparisons and sorting
+            self.name = bytes(PatchTool.read_byte_array(archiveData, entryOffset, 32))
 
-            # Read various integer values (each 4 bytes long) immediately following the name
-            offsetFromEnd = PatchTool.read_uint32(archiveData, entryOffset + 32)
-            compressedSize = PatchTool.read_uint32(archiveData, entryOffset + 36)
-            self.uncompressedSize = PatchTool.read_uint32(archiveData, entryOffset + 40)
-            self.isCompressed = (bool)(PatchTool.read_uint32(archiveData, entryOffset + 44))
+            # Read the four unsigned integer values (each 4 bytes long) immediately following the name in one unpack
+            offsetFromEnd, compressedSize, self.uncompressedSize, isCompressed = \
+                _UNPACK_4U32(archiveData, entryOffset + 32)
+            self.isCompressed = bool(isCompressed)
 
             # Calculate the start position of the entry's data based on its offset from the end of the file
             dataStart = len(archiveData) - offsetFromEnd
@@ -478,9 +944,10 @@ class BNKEntry:
         elif len(args) == 1 and isinstance(args[0], BNKWrappedEntry):
             entry = args[0]
 
-            # Converts a BNKWrappedEntry back into a BNKEntry by decoding the Base64 encoded data and name
-            self.data = base64.b64decode(entry.data)
-            self.name = base64.b64decode(entry.name)
+            # Converts a BNKWrappedEntry back into a BNKEntry using its raw byte properties directly,
+            # avoiding a Base64 decode round-trip
+            self.data = entry.data_raw
+            self.name = entry.name_raw
             self.uncompressedSize = entry.uncompressedSize
             self.isCompressed = entry.isCompressed
         else:
@@ -498,9 +965,43 @@ class BNKEntry:
         """
         return BNKWrappedEntry(self)
 
+    @classmethod
+    def from_record(cls, record, archiveData):
+        """
+        Creates a BNKEntry from one row of a bulk-parsed directory table.
+
+        Used by BNKArchive when the whole 48-byte-per-entry directory has been decoded in a single
+        NumPy structured-array pass; the row carries the already-unpacked header fields. The
+        (archiveData, entryOffset) constructor remains the single-entry fallback.
+
+        Parameters:
+            record (numpy.void): A structured-array row with the _ENTRY_DTYPE layout.
+            archiveData (bytes): The archive's data, used to extract the entry's payload.
+
+        Returns:
+            BNKEntry: The constructed entry.
+        """
+        entry = cls()
+        # NumPy strips the trailing null padding from 'S32' fields, so restore the fixed 32 bytes
+        entry.name = bytes(record['name']).ljust(32, b'\0')
+        entry.uncompressedSize = int(record['usize'])
+        entry.isCompressed = bool(record['flag'])
+
+        # Calculate the start position of the entry's data based on its offset from the end of the file
+        compressedSize = int(record['csize'])
+        dataStart = len(archiveData) - int(record['off'])
+
+        # Additional validation to ensure the offset and size do not exceed the archive data boundaries
+        if dataStart < 0 or dataStart + compressedSize > len(archiveData):
+            raise ValueError(f"Invalid offset for file entry '{PatchTool.read_string(entry.name)}'")
+
+        # Extract the data segment based on the calculated start position and compressed size
+        entry.data = PatchTool.read_byte_array(archiveData, dataStart, compressedSize)
+        return entry
+
     def clone(self):
         """
-        Creates a deep copy of the current BNKEntry object.
+        Creates an independent copy of the current BNKEntry object.
 
         The cloned entry will have the same data, name, uncompressedSize, and isCompressed properties.
 
@@ -510,11 +1011,10 @@ class BNKEntry:
         # Create a new BNKEntry object for the clone
         clone = BNKEntry()
 
-        # Perform a deep copy of the data byte array
-        clone.data = self.data[:] if self.data else None
-
-        # Perform a deep copy of the name byte array
-        clone.name = self.name[:] if self.name else None
+        # The data and name buffers are immutable and only ever rebound (never mutated in place),
+        # so the clone shares them instead of copying, making clone() O(1)
+        clone.data = self.data
+        clone.name = self.name
 
         # Copy the compression-related properties as they are
         clone.uncompressedSize = self.uncompressedSize
@@ -523,30 +1023,42 @@ class BNKEntry:
         # Return the cloned BNKEntry object
         return clone
 
+    @property
+    def cf_name(self):
+        """
+        The entry's name decoded and casefolded, memoized on first access.
+
+        The name only changes through rename, which invalidates the memo, so repeated index
+        operations pay for the decode and casefold once per entry.
+        """
+        if self._cf_name is None:
+            self._cf_name = PatchTool.read_string(self.name).casefold()
+        return self._cf_name
+
     def rename(self, newName):
         """
         Changes the name of the entry.
 
         Sets a new name for the entry. Throws an exception if the new name exceeds the 32-byte limit.
 
+        Only safe for entries that are not stored in an archive: the archive keys its entry
+        collection by name, so renaming a stored entry must go through BNKArchive.rename_entry,
+        which re-keys the collection.
+
         Parameters:
             newName (str): The new name to set for the entry.
         """
         # Convert the string to a byte array (UTF8 encoding)
-        newNameBytes = newName.encode('utf-8')
+        newNameBytes = newName.encode()
 
         # Check if the byte array exceeds 32 bytes
         if len(newNameBytes) > 32:
             raise ValueError("New name exceeds the maximum allowed length of 32 bytes.")
 
-        # Calculate the number of padding bytes needed
-        paddingLength = 32 - len(newNameBytes)
-
-        # Concatenate the newNameBytes with the padding bytes
-        paddedNameBytes = newNameBytes + bytes(paddingLength)
-
-        # Assign the padded byte array to the name
-        self.name = paddedNameBytes
+        # Pad the name out to the fixed 32-byte field in a single allocation
+        self.name = newNameBytes.ljust(32, b'\x00')
+        # Invalidate the memoized casefolded name
+        self._cf_name = None
 
     def decompress(self):
         """
@@ -558,42 +1070,15 @@ class BNKEntry:
         if not self.isCompressed:
             return  # Data is not compressed; no action needed.
 
-        decompressed_data = bytearray()
-        dest_buffer = bytearray(4096)  # Circular buffer for back-references
-        buffer_pointer = 0xFEE  # Initial buffer pointer, specific to decompression logic
-
-        i = 0
-        while i < len(self.data):
-            control_byte = self.data[i]
-            i += 1
-
-            for bit in range(8):
-                if i >= len(self.data):
-                    break  # End of data reached
-
-                if control_byte & (1 << bit):
-                    # Literal byte copy operation
-                    byte = self.data[i]
-                    i += 1
-                    decompressed_data.append(byte)
-                    dest_buffer[buffer_pointer] = byte
-                    buffer_pointer = (buffer_pointer + 1) & 0xFFF
-                else:
-                    # Back-reference copy operation
-                    if i + 1 >= len(self.data):
-                        break  # Prevent buffer overrun
-
-                    offset = ((self.data[i + 1] & 0xF0) << 4) | self.data[i]
-                    length = (self.data[i + 1] & 0x0F) + 3
-                    i += 2
-
-                    for j in range(length):
-                        byte = dest_buffer[(offset + j) & 0xFFF]
-                        decompressed_data.append(byte)
-                        dest_buffer[buffer_pointer] = byte
-                        buffer_pointer = (buffer_pointer + 1) & 0xFFF
-
-        self.data = bytes(decompressed_data)
+        # Run the compressed stream through the JIT-compiled kernel when Numba is available,
+        # otherwise through the optimized pure-Python fallback; the kernels work entirely on local
+        # references, so no attribute is resolved inside the hot loop
+        data = self.data
+        if njit is not None:
+            self.data = _lzss_decompress(np.frombuffer(data, dtype=np.uint8),
+                                         self.uncompressedSize).tobytes()
+        else:
+            self.data = _lzss_decompress_py(data, self.uncompressedSize)
         self.isCompressed = False  # Mark as decompressed
 
         # Make sure the decompressed size matches the expected size
@@ -606,8 +1091,8 @@ class BNKWrappedEntry:
     """
     Represents a wrapped version of a BNKEntry object with Base64 encoded data.
 
-    BNKWrappedEntry encodes BNKEntry object data and names into Base64. It retains the original entry properties and
-    supports conversion back to BNKEntry.
+    BNKWrappedEntry stores the entry's data and name as raw bytes and exposes Base64 encoded views of them, computed
+    lazily on first access. It retains the original entry properties and supports conversion back to BNKEntry.
     """
 
     def __init__(self, *args):
@@ -628,16 +1113,28 @@ class BNKWrappedEntry:
         """
         if len(args) == 1 and isinstance(args[0], BNKEntry):
             entry = args[0]
-            self.data = base64.b64encode(entry.data).decode('utf-8')
-            self.name = base64.b64encode(entry.name).decode('utf-8')
+            self.data_raw = bytes(entry.data)
+            self.name_raw = bytes(entry.name)
             self.uncompressedSize = entry.uncompressedSize
             self.isCompressed = entry.isCompressed
         elif len(args) == 4 and isinstance(args[0], str) and isinstance(args[1], str) and \
                                 isinstance(args[2], int) and isinstance(args[3], int):
-            self.data, self.name, self.uncompressedSize, self.isCompressed = args
+            data, name, self.uncompressedSize, self.isCompressed = args
+            self.data_raw = base64.b64decode(data)
+            self.name_raw = base64.b64decode(name)
         else:
             raise ValueError("Invalid arguments for BNKWrappedEntry constructor")
 
+    @functools.cached_property
+    def data(self):
+        """str: The entry's data as a Base64 encoded string, computed on first access."""
+        return base64.b64encode(self.data_raw).decode('utf-8')
+
+    @functools.cached_property
+    def name(self):
+        """str: The entry's name as a Base64 encoded string, computed on first access."""
+        return base64.b64encode(self.name_raw).decode('utf-8')
+
     def unwrap(self):
         """
         Converts the wrapped entry back into a BNKEntry object.
@@ -657,7 +1154,7 @@ class BNKWrappedEntry:
         This method generates and prints a Python command line that can be used to recreate the current
         BNKWrappedEntry object. Useful for debugging or logging the state of the object.
         """
-        converted_name_str = PatchTool.read_string(base64.b64decode(self.name)).replace('.', '_').lower() + "_entry"
+        converted_name_str = PatchTool.read_string(self.name_raw).replace('.', '_').lower() + "_entry"
         print(f'{converted_name_str} = BNKWrappedEntry("{self.data}", "{self.name}", {self.uncompressedSize}, {self.isCompressed}' +
               f').unwrap()')
 
@@ -683,11 +1180,47 @@ class BNKArchive:
             raise Exception(f"'{archivePath}' not found!")
 
         self.archivePath = archivePath
-        self.entries = []  # Initialize the entries list as empty
 
-        # Read the entire file as a byte array
-        with open(archivePath, "rb") as file:
-            archiveData = file.read()
+        # Memory-map the file instead of reading it: entry payloads stay zero-copy views
+        # into the mapping until save() materializes them
+        fd = os.open(archivePath, os.O_RDONLY)
+        try:
+            archiveData = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+        finally:
+            os.close(fd)
+
+        self._parse(archiveData)
+
+    @classmethod
+    def from_buffer(cls, archivePath, archiveData):
+        """
+        Constructs a BNKArchive from an already-read buffer.
+
+        Used when the caller has the archive contents in hand (e.g. a memory map opened while
+        writing the backup), so the file is not read a second time. The buffer is kept referenced
+        for as long as entry payloads view into it.
+
+        Parameters:
+            archivePath (str): The file path the archive was read from.
+            archiveData (bytes-like): The complete archive contents.
+
+        Returns:
+            BNKArchive: The parsed archive.
+        """
+        archive = cls.__new__(cls)
+        archive.archivePath = archivePath
+        archive._parse(archiveData)
+        return archive
+
+    def _parse(self, archiveData):
+        """
+        Parses archive contents into entries, validating the footer.
+
+        Parameters:
+            archiveData (bytes-like): The complete archive contents.
+        """
+        # Keep the backing buffer alive while entry payloads are zero-copy views into it
+        self._buffer = archiveData
 
         # Calculate the start position of the footer data, assuming the footer is 18 bytes from the end
         footerStart = len(archiveData) - 18
@@ -705,14 +1238,19 @@ class BNKArchive:
         # Calculate the starting offset for entries in the archive
         entryOffset = len(archiveData) - 18 - (fileCount * 48)  # 48 bytes per directory entry
 
-        # Extract each entry from the archive data
-        for i in range(fileCount):
-            # Create a new BNKEntry from the archive data at the current offset
-            entry = BNKEntry(archiveData, entryOffset)
-            # Append the entry to the entries list
-            self.entries.append(entry)
-            # Move to the next entry's offset
-            entryOffset += 48
+        # Decode the whole directory in one structured-array pass and build the entries from the
+        # already-unpacked rows
+        entryTable = np.frombuffer(archiveData, dtype=_ENTRY_DTYPE, count=fileCount, offset=entryOffset)
+
+        # Entries live in an insertion-ordered dict keyed by casefolded name, so lookups and
+        # removals are O(1) dictionary operations and iterating the values preserves file order
+        self.entries = {entry.cf_name: entry
+                        for entry in (BNKEntry.from_record(record, archiveData) for record in entryTable)}
+
+        # The name-sorted entry list save() writes is cached until membership changes; the on-disk
+        # order is not guaranteed to be sorted, so the first save always sorts
+        self._dirty_sort = True
+        self._sorted_entries = None
 
     def has_entry(self, name):
         """
@@ -727,13 +1265,8 @@ class BNKArchive:
         Returns:
             bool: True if the entry exists in the archive, False otherwise.
         """
-        for entry in self.entries:
-            # Perform a case-insensitive comparison of the entry's name with the provided name
-            if PatchTool.read_string(entry.name).casefold() == name.casefold():
-                return True
-
-        # Return false if no entry with the specified name is found
-        return False
+        # Probe the case-insensitive name index
+        return name.casefold() in self.entries
 
     def get_entry(self, name):
         """
@@ -747,13 +1280,8 @@ class BNKArchive:
         Returns:
             BNKEntry: A reference to the entry object if found, otherwise None.
         """
-        for entry in self.entries:
-            # Perform a case-insensitive comparison of the entry's name with the provided name
-            if PatchTool.read_string(entry.name).casefold() == name.casefold():
-                return entry
-
-        # Return None if no entry with the specified name is found
-        return None
+        # Probe the case-insensitive name index; returns None on a miss
+        return self.entries.get(name.casefold())
 
     def clone_entry(self, name):
         """
@@ -769,38 +1297,55 @@ class BNKArchive:
         """
         return found_entry.clone() if (found_entry := self.get_entry(name)) else None
 
-    def add_entry(self, *args):
+    def rename_entry(self, name, new_name):
         """
-        Adds a new entry to the archive or replaces an existing one, based on the provided arguments.
+        Renames an existing entry in the archive.
+
+        Re-keys the name-keyed entry collection alongside renaming the entry itself, so lookups
+        under the new name hit and the old name no longer resolves.
 
         Parameters:
-            *args: A variable argument list that can be:
-                (entry: BNKEntry):
-                     Adds the entry with its own name.
-                (entry: BNKEntry, force_replace: bool):
-                     Adds or replaces the entry with its own name based on force_replace.
-                (entry_name: str, entry: BNKEntry):
-                     Adds the entry with a specified name.
-                (entry_name: str, entry: BNKEntry, force_replace: bool):
-                     Adds or replaces the entry with a specified name based on force_replace.
+            name (str): The current name of the entry to rename.
+            new_name (str): The new name for the entry.
+
+        Raises:
+            ValueError: If the entry is not found, or if an entry with the new name already exists.
+        """
+        # Validation
+        if not name:
+            raise ValueError("Entry name cannot be null or empty.")
+        if not new_name:
+            raise ValueError("New entry name cannot be null or empty.")
+
+        if (entry := self.entries.pop(name.casefold(), None)) is None:
+            raise ValueError(f"Entry with name '{name}' not found.")
+
+        if new_name.casefold() in self.entries:
+            # Put the entry back before failing so the archive is left untouched
+            self.entries[name.casefold()] = entry
+            raise ValueError(f"An entry with the name '{new_name}' already exists.")
+
+        # Rename the entry and re-insert it under its new key; the cached sorted order is
+        # name-based, so it goes stale here just as it does on add and remove
+        entry.rename(new_name)
+        self.entries[new_name.casefold()] = entry
+        self._dirty_sort = True
+
+    def add_entry_as(self, entry_name, entry, force_replace=False):
+        """
+        Adds a new entry to the archive under the given name, or replaces an existing one when
+        force_replace is set.
+
+        Parameters:
+            entry_name (str): The name to store the entry under.
+            entry (BNKEntry): The entry to add.
+            force_replace (bool, optional): If True, an existing entry with the same name is replaced
+                                            instead of raising. Defaults to False.
 
         Raises:
             ValueError: For various conditions such as entry name conflicts without force replacement, missing entry
                         data, etc.
         """
-        # Check arguments and determine the logic to use
-        if len(args) == 1 and isinstance(args[0], BNKEntry):
-            entry_name, entry, force_replace = args[0].name, args[0], False
-        elif len(args) == 2 and isinstance(args[0], BNKEntry) and isinstance(args[1], bool):
-            entry_name, entry, force_replace = args[0].name, args[0], args[1]
-        elif len(args) == 2 and isinstance(args[0], str) and isinstance(args[1], BNKEntry):
-            entry_name, entry, force_replace = args[0], args[1], False
-        elif len(args) == 3 and isinstance(args[0], str) and isinstance(args[1], BNKEntry) and \
-             isinstance(args[2], bool):
-            entry_name, entry, force_replace = args[0], args[1], args[2]
-        else:
-            raise ValueError("Invalid argument combination for add_entry.")
-
         # Common validation and logic for adding or replacing entries
         if not entry_name:
             raise ValueError("Entry name cannot be null or empty.")
@@ -814,45 +1359,63 @@ class BNKArchive:
             if not force_replace:
                 raise ValueError(f"An entry with the name '{entry_name}' already exists.")
             else:
-                # Replace existing entry's data and properties
-                found_entry.data = entry.data[:]
+                # Replace existing entry's data and properties. Payloads are treated as
+                # immutable throughout (writers rebind, never mutate), so sharing the reference
+                # is safe and skips a full copy of the payload.
+                found_entry.data = entry.data
                 found_entry.uncompressedSize = entry.uncompressedSize
                 found_entry.isCompressed = entry.isCompressed
         else:
             # Clone and potentially rename the new entry for independence
             clone = entry.clone()
-            if entry.name != entry_name:
+            if PatchTool.read_string(entry.name) != entry_name:
                 clone.rename(entry_name)
 
-            # Add the new entry
-            self.entries.append(clone)
-
+            # Add the new entry to the name-keyed entry dict and invalidate the sorted cache
+            self.entries[entry_name.casefold()] = clone
+            self._dirty_sort = True
 
-    def replace_entry(self, *args):
+    def add_entry(self, *args):
         """
-        Replaces an existing entry in the archive, allowing for replacement specified either by an entry object or by
-        both an entry's name and the entry object.
+        Back-compat shim for add_entry_as, kept so existing varargs call sites keep working.
 
         Parameters:
             *args: A variable argument list that can be:
                 (entry: BNKEntry):
-                    Replaces the entry with its own name in the BNKEntry object.
+                     Adds the entry with its own name.
+                (entry: BNKEntry, force_replace: bool):
+                     Adds or replaces the entry with its own name based on force_replace.
                 (entry_name: str, entry: BNKEntry):
-                    Replaces the entry specified by the entry_name with the properties of the BNKEntry object.
-
-        Raises:
-            ValueError: If the specified entry is not found in the archive, or if other validation checks fail (such as
-                        null entry name, null entry, or zero length data).
+                     Adds the entry with a specified name.
+                (entry_name: str, entry: BNKEntry, force_replace: bool):
+                     Adds or replaces the entry with a specified name based on force_replace.
         """
-        # Check arguments and determine the logic to use
+        # Route on argument shape, then defer to the typed method
         if len(args) == 1 and isinstance(args[0], BNKEntry):
-            entry = args[0]
-            entry_name = entry.name
+            self.add_entry_as(PatchTool.read_string(args[0].name), args[0])
+        elif len(args) == 2 and isinstance(args[0], BNKEntry) and isinstance(args[1], bool):
+            self.add_entry_as(PatchTool.read_string(args[0].name), args[0], args[1])
         elif len(args) == 2 and isinstance(args[0], str) and isinstance(args[1], BNKEntry):
-            entry_name, entry = args
+            self.add_entry_as(args[0], args[1])
+        elif len(args) == 3 and isinstance(args[0], str) and isinstance(args[1], BNKEntry) and \
+             isinstance(args[2], bool):
+            self.add_entry_as(args[0], args[1], args[2])
         else:
-            raise ValueError("Invalid arguments for replace_entry.")
+            raise ValueError("Invalid argument combination for add_entry.")
+
 
+    def replace_entry_as(self, entry_name, entry):
+        """
+        Replaces the existing entry with the given name with the properties of the supplied entry.
+
+        Parameters:
+            entry_name (str): The name of the entry to replace.
+            entry (BNKEntry): The entry whose properties replace the existing one's.
+
+        Raises:
+            ValueError: If the specified entry is not found in the archive, or if other validation checks fail (such as
+                        null entry name, null entry, or zero length data).
+        """
         # Common validation and logic for replacing entries
         if not entry_name:
             raise ValueError("Entry name cannot be null or empty.")
@@ -865,11 +1428,30 @@ class BNKArchive:
         if (found_entry := self.get_entry(entry_name)) is None:
             raise ValueError(f"Entry with name '{entry_name}' not found.")
 
-        # Replace the found entry's data and properties
-        found_entry.data = entry.data[:]
+        # Replace the found entry's data and properties, sharing the immutable payload
+        found_entry.data = entry.data
         found_entry.uncompressedSize = entry.uncompressedSize
         found_entry.isCompressed = entry.isCompressed
 
+    def replace_entry(self, *args):
+        """
+        Back-compat shim for replace_entry_as, kept so existing varargs call sites keep working.
+
+        Parameters:
+            *args: A variable argument list that can be:
+                (entry: BNKEntry):
+                    Replaces the entry with its own name in the BNKEntry object.
+                (entry_name: str, entry: BNKEntry):
+                    Replaces the entry specified by the entry_name with the properties of the BNKEntry object.
+        """
+        # Route on argument shape, then defer to the typed method
+        if len(args) == 1 and isinstance(args[0], BNKEntry):
+            self.replace_entry_as(PatchTool.read_string(args[0].name), args[0])
+        elif len(args) == 2 and isinstance(args[0], str) and isinstance(args[1], BNKEntry):
+            self.replace_entry_as(args[0], args[1])
+        else:
+            raise ValueError("Invalid arguments for replace_entry.")
+
     def remove_entry(self, name, ignore_not_found=False):
         """
         Removes an existing entry in the archive.
@@ -888,11 +1470,13 @@ class BNKArchive:
         if name is None:
             raise ValueError("Name cannot be null.")
 
-        # Attempt to find the entry by name with a default value of None if not found
-        entry_to_remove = next((entry for entry in self.entries if entry.name == name), None)
+        # Accept the legacy raw 32-byte name form alongside plain strings
+        if isinstance(name, (bytes, bytearray)):
+            name = PatchTool.read_string(name)
 
-        if entry_to_remove:
-            self.entries.remove(entry_to_remove)
+        # Pop the entry straight out of the name-keyed dict
+        if self.entries.pop(name.casefold(), None) is not None:
+            self._dirty_sort = True
         elif not ignore_not_found:
             raise ValueError(f"Entry with name '{name}' not found.")
 
@@ -910,33 +1494,66 @@ class BNKArchive:
         if not file_name:
             raise ValueError("File name cannot be empty.")
 
-        # Sort entries before saving
-        self.entries.sort(key=lambda entry: entry.name)
-
-        # Open a file for writing
-        with open(file_name, 'wb') as file_stream:
-            offset_from_end = len(self.entries) * 48 + 18  # Add directory and footer sizes
-
-            # Write each entry's data to the file stream
-            for entry in self.entries:
-                file_stream.write(entry.data)
-                offset_from_end += len(entry.data)
-
-            # Write metadata for each entry
-            for entry in self.entries:
-                if len(entry.name) != 32:
-                    raise ValueError(f"Error Saving: Entry name '{entry.name}' must be exactly 32 bytes when encoded.")
-
-                file_stream.write(entry.name)
-                file_stream.write(pack('<I', offset_from_end))  # Unsigned int, little-endian
-                file_stream.write(pack('<I', len(entry.data)))
-                file_stream.write(pack('<I', entry.uncompressedSize))
-                file_stream.write(pack('<I', int(entry.isCompressed)))
-                offset_from_end -= len(entry.data)
-
-            # Write the footer information
-            footer = b"Wildfire\x00\x00\x00\x00\x01\x00" + pack('<I', len(self.entries))
-            file_stream.write(footer)
+        # Sort entries before saving, reusing the cached order when membership has not changed
+        if self._dirty_sort:
+            self._sorted_entries = sorted(self.entries.values(), key=lambda entry: entry.name)
+            self._dirty_sort = False
+        entries = self._sorted_entries
+
+        # Materialize payloads that are still zero-copy views before the file is opened for
+        # writing: truncating a file that entry data still maps would fault. bytes() is a no-op
+        # for payloads that are already independent bytes objects.
+        for entry in entries:
+            entry.data = bytes(entry.data)
+
+        # The backing buffer is no longer needed once every payload is independent
+        self._buffer = None
+
+        # Assemble the directory and footer in one bytearray so the whole trailer goes out in a
+        # single write instead of four small writes per entry
+        offset_from_end = len(entries) * 48 + 18  # Add directory and footer sizes
+        for entry in entries:
+            offset_from_end += len(entry.data)
+
+        directory = bytearray(len(entries) * 48 + 18)
+        position = 0
+        for entry in entries:
+            if len(entry.name) != 32:
+                raise ValueError(f"Error Saving: Entry name '{entry.name}' must be exactly 32 bytes when encoded.")
+
+            _S_DIRENT.pack_into(directory, position, entry.name, offset_from_end, len(entry.data),
+                                entry.uncompressedSize, int(entry.isCompressed))
+            position += 48
+            offset_from_end -= len(entry.data)
+
+        # Append the footer information
+        directory[position:] = b"Wildfire\x00\x00\x00\x00\x01\x00" + _S_U32.pack(len(entries))
+
+        if hasattr(os, 'writev'):
+            # Gather every payload plus the directory buffer into as few writev syscalls as the
+            # platform allows; the vector length is capped (IOV_MAX) and writes may be partial,
+            # so advance through the buffer list until everything is out
+            buffers = [entry.data for entry in entries]
+            buffers.append(directory)
+
+            fd = os.open(file_name, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+            try:
+                index = 0
+                while index < len(buffers):
+                    written = os.writev(fd, buffers[index:index + 1024])
+                    while index < len(buffers) and written >= len(buffers[index]):
+                        written -= len(buffers[index])
+                        index += 1
+                    if written:
+                        buffers[index] = memoryview(buffers[index])[written:]
+            finally:
+                os.close(fd)
+        else:
+            # Windows has no writev; a large write buffer still coalesces the payloads
+            with open(file_name, 'wb', buffering=1 << 20) as file_stream:
+                for entry in entries:
+                    file_stream.write(entry.data)
+                file_stream.write(directory)
 
     def dump(self):
         # Create the PatchBackups directory if it doesn't exist
@@ -948,64 +1565,68 @@ class BNKArchive:
         if not os.path.exists(bnk_sub_dump_dir):
             os.makedirs(bnk_sub_dump_dir)
 
-        for entry in self.entries:
+        for entry in self.entries.values():
             entry.decompress()
 
             extracted_filename = os.path.join(bnk_sub_dump_dir, PatchTool.read_string(entry.name))
             with open(extracted_filename, 'wb') as extracted_file:
                extracted_file.write(entry.data)
 
-class SpriteChunk:
-    def __init__(self, archive_data, offset):
-        self.archive_data = archive_data
-        self.draw_offset = PatchTool.read_int16(archive_data, offset)
-        self.chunk_length = PatchTool.read_uint16(archive_data, offset + 2)
-        offset += 4
-
-        if self.chunk_length == 0x0:
-            # raise Exception("Sprite Chunk Length of zero not allowed (@ file offset {})".format(offset - 2))
-            self.chunk_offset = 0
-        elif self.chunk_length != 0xFFFF:
-            self.chunk_offset = offset
-        else:
-            self.chunk_offset = 0
-            # self.data = archive_data[offset:offset+self.chunk_length]
-
-    def get_byte(self, index):
-        return self.archive_data[self.chunk_offset + index]
-
-    def total_size(self):
-        if self.chunk_offset != 0:
-            return 4 + self.chunk_length
-        else:
-            return 4
+# Chunk records live structure-of-arrays style in three parallel arrays on Sprite; this
+# lightweight view is what the chunks iterator yields for callers that want per-chunk objects.
+SpriteChunk = namedtuple('SpriteChunk', ('draw_offset', 'chunk_length', 'chunk_offset'))
 
 class Sprite:
     def __init__(self, archive_data, offset):
-        self.chunks = []  # Initialize the chunks list as empty
-
-        self.width = PatchTool.read_uint32(archive_data, offset)
-        self.height = PatchTool.read_uint32(archive_data, offset + 4)
-        self.center_x = PatchTool.read_uint32(archive_data, offset + 8)
-        self.center_y = PatchTool.read_uint32(archive_data, offset + 12)
-        sprite_length = PatchTool.read_uint32(archive_data, offset + 16)
+        self.width, self.height, self.center_x, self.center_y, sprite_length = \
+            _SPRITE_HDR.unpack_from(archive_data, offset)
         offset += self.header_size()
 
+        # Walk the variable-length chunk records once, collecting the three header fields into
+        # parallel lists; a chunk offset of zero marks the payload-less records (length 0 or the
+        # 0xFFFF skip marker)
+        draw_offsets = []
+        chunk_lengths = []
+        chunk_offsets = []
+        unpack_chunk = _CHUNK_HDR.unpack_from
+
         sprite_end = offset + sprite_length
         while offset < sprite_end:
-            chunk = SpriteChunk(archive_data, offset)
-            self.chunks.append(chunk)
-            offset += chunk.total_size()
+            draw_offset, chunk_length = unpack_chunk(archive_data, offset)
+            offset += 4
+
+            draw_offsets.append(draw_offset)
+            chunk_lengths.append(chunk_length)
+            if chunk_length != 0x0 and chunk_length != 0xFFFF:
+                chunk_offsets.append(offset)
+                offset += chunk_length
+            else:
+                chunk_offsets.append(0)
+
+        # Store the records as compact parallel arrays instead of a list of per-chunk objects
+        self.draw_offsets = np.asarray(draw_offsets, dtype=np.int16)
+        self.chunk_lengths = np.asarray(chunk_lengths, dtype=np.uint16)
+        self.chunk_offsets = np.asarray(chunk_offsets, dtype=np.int32)
 
         if sprite_length != self.chunks_size():
             raise Exception(f"Sprite Length does not match decoded sprite length in file ({sprite_length}" +
                             f" != {self.chunks_size()})")
 
+    @property
+    def chunks(self):
+        """Yields the chunk records as SpriteChunk namedtuples, in file order."""
+        for draw_offset, chunk_length, chunk_offset in zip(self.draw_offsets.tolist(),
+                                                           self.chunk_lengths.tolist(),
+                                                           self.chunk_offsets.tolist()):
+            yield SpriteChunk(draw_offset, chunk_length, chunk_offset)
+
     def header_size(self):
         return 4 * 5
 
     def chunks_size(self):
-        return sum(chunk.total_size() for chunk in self.chunks)
+        lengths = self.chunk_lengths
+        payload = lengths[(lengths != 0x0) & (lengths != 0xFFFF)].sum()
+        return 4 * len(lengths) + int(payload)
 
     def total_size(self):
         return self.header_size() + self.chunks_size()
@@ -1019,9 +1640,15 @@ class SpriteBank:
         self.archive_path = archive_path
         self.sprites = []  # Initialize the sprites list as empty
 
-        # Read the entire file as a byte array
-        with open(archive_path, 'rb') as file:
-            archive_data = file.read()
+        # Memory-map the file: chunk payloads are read straight out of the page cache on demand
+        fd = os.open(archive_path, os.O_RDONLY)
+        try:
+            archive_data = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+        finally:
+            os.close(fd)
+
+        # Keep the mapping alive for as long as the chunks reference it
+        self.archive_data = archive_data
 
         sprite_count = self.read_uint32(archive_data, 0)
 
@@ -1048,47 +1675,41 @@ class SpriteBank:
 
     @staticmethod
     def read_uint32(data, offset):
-        # Assuming data is a bytes-like object
-        return int.from_bytes(data[offset:offset+4], byteorder='little', signed=False)
+        # Unpacks a 32-bit integer directly from the byte array at the given offset
+        return _UNPACK_U32(data, offset)[0]
 
     def dump(self, palette):
+        # Resolve everything the per-sprite loop needs to local references once, up front
+        np_map = palette.np_map
+        archive = np.frombuffer(self.archive_data, dtype=np.uint8)
+        render = _render_sprite if njit is not None else _render_sprite_py
+        directory_path, file_name = os.path.split(self.archive_path)
+
         sprite_index = 0
         for sprite in self.sprites:
-            if sprite.width == 0 or sprite.height == 0:
+            width = sprite.width
+            height = sprite.height
+            if width == 0 or height == 0:
                 continue
 
-            # Create a new image for each sprite with a transparent background
-            img = Image.new('RGBA', (sprite.width, sprite.height), (0, 0, 0, 0))
-            draw_offset = 0
-
-            for chunk in sprite.chunks:
-                if chunk.draw_offset >= 0:
-                    draw_offset += chunk.draw_offset
-                else:
-                    draw_offset += sprite.width + chunk.draw_offset + 1
-
-                if chunk.chunk_length == 0xFFFF:
-                    continue
-
-                chunk_start_y = draw_offset // sprite.width
-                for i in range(min(chunk.chunk_length, 0xFFFF)):
-                    x = draw_offset % sprite.width
-                    y = draw_offset // sprite.width
+            # Assemble each sprite in an RGBA pixel array; untouched pixels stay transparent.
+            # Chunks address pixels by linear draw offset, so the kernel writes a flat view.
+            arr = np.zeros((height, width, 4), dtype=np.uint8)
+            flat = arr.reshape(-1, 4)
 
-                    if chunk_start_y != y:
-                        raise Exception(f"y={chunk_start_y} changed to {y}" +
-                                        f" in middle of chunk with drawoffset of {chunk.draw_offset} {i}" +
-                                        f" {chunk.chunk_length}")
+            bad, fail_offset = render(archive, sprite.chunk_offsets, sprite.chunk_lengths,
+                                      sprite.draw_offsets, width, np_map, flat)
+            if bad >= 0:
+                draw_offset = int(sprite.draw_offsets[bad])
+                length = int(sprite.chunk_lengths[bad])
+                raise Exception(f"y={fail_offset // width} changed to" +
+                                f" {(fail_offset + length - 1) // width}" +
+                                f" in middle of chunk with drawoffset of {draw_offset}" +
+                                f" {length}")
 
-                    color = palette.get_color(chunk.get_byte(i)) # Assuming palette.get() returns an (R,G,B,A) tuple
-                    # print(color)
-                    img.putpixel((x, y), color)
+            img = Image.fromarray(arr, 'RGBA')
 
-                    draw_offset += 1
-
-            # Generate output file path
-            directory_path, file_name = os.path.split(self.archive_path)
-            # Using PNG to support transparency
+            # Generate output file path; using PNG to support transparency
             out_file_path = os.path.join(directory_path, f"{file_name}.{sprite_index}.png")
             print(f"Writing file {out_file_path}")
             img.save(out_file_path)
@@ -1106,9 +1727,15 @@ class ColorPalette:
         self.archive_path = archive_path
         self.map = [None] * 256  # Initialize color map with placeholders
 
-        # Read the entire file as a byte array
-        with open(archive_path, 'rb') as file:
-            archive_data = file.read()
+        # Memory-map the file rather than copying it into the heap
+        fd = os.open(archive_path, os.O_RDONLY)
+        try:
+            archive_data = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+        finally:
+            os.close(fd)
+
+        # Keep the mapping alive while the lookup tables below view into it
+        self.archive_data = archive_data
 
         for i in range(256):
             base_index = 32 + i * 3
@@ -1117,6 +1744,13 @@ class ColorPalette:
             b = archive_data[base_index + 2]
             self.map[i] = (r, g, b)  # Store as an RGB tuple
 
+        # Palette as a (256, 4) RGBA lookup table for vectorized sprite rendering. The alpha
+        # column is opaque, matching how an (R, G, B) putpixel behaves on an RGBA image.
+        rgb = np.frombuffer(archive_data, dtype=np.uint8, count=256 * 3, offset=32).reshape(256, 3)
+        self.np_map = np.empty((256, 4), dtype=np.uint8)
+        self.np_map[:, :3] = rgb
+        self.np_map[:, 3] = 255
+
     def get_color(self, index):
         return self.map[index]
 
@@ -1124,19 +1758,29 @@ class ColorPalette:
         directory_path = os.path.dirname(self.archive_path)
 
         # Define the extensions of sprite files to process
-        extensions = ['.SPB', '.SP0', '.SP1', '.DSB', '.DS0', '.DS1']
-        # Create a pattern that matches any of the specified extensions
-        file_patterns = [os.path.join(directory_path, f"*{ext}") for ext in extensions]
-
-        for pattern in file_patterns:
-            for file_path in glob.glob(pattern):
-                print(f"Processing file: {file_path}")
-                try:
-                    sprite_bank = SpriteBank(file_path)
-                    sprite_bank.dump(self)
-                except Exception as e:
-                    print(f"Error processing {file_path}: {e}")
-                    failed_entries.append(file_path)
+        extensions = {'.SPB', '.SP0', '.SP1', '.DSB', '.DS0', '.DS1'}
+
+        # A single scandir pass with an O(1) extension-set probe replaces six glob walks over the
+        # same directory; the files are dispatched to the pool in one go
+        with os.scandir(directory_path or '.') as it:
+            files = sorted(os.path.join(directory_path, entry.name) for entry in it
+                           if entry.is_file() and os.path.splitext(entry.name)[1].upper() in extensions)
+
+        def dump_one(file_path):
+            print(f"Processing file: {file_path}")
+            try:
+                sprite_bank = SpriteBank(file_path)
+                sprite_bank.dump(self)
+            except Exception as e:
+                print(f"Error processing {file_path}: {e}")
+                failed_entries.append(file_path)
+
+        # Render the banks in parallel: each file is independent, and the PNG encode (plus the
+        # NumPy work in dump) runs outside the GIL for most of its time. Threads rather than
+        # processes, because importing this module executes the patch script, which worker
+        # processes under the spawn start method would re-run.
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            list(executor.map(dump_one, files))
 
 
 try: